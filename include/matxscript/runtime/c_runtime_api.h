@@ -548,6 +548,26 @@ MATX_DLL int MATXScriptFuncGetGlobal(const char* name, MATXScriptFunctionHandle*
  */
 MATX_DLL int MATXScriptFuncListGlobalNames(int* out_size, const char*** out_array);
 
+/*!
+ * \brief List the globally registered functions whose name starts with prefix,
+ *  together with their handles, in a single call.
+ *
+ *  Names that contain another '.' after the prefix are skipped, so for a prefix
+ *  like "runtime." only the direct members of that namespace are returned.
+ * \param prefix The name prefix to filter on.
+ * \param out_size The number of functions
+ * \param out_names The array of function names.
+ * \param out_handles The array of function handles, one for each name.
+ * \return 0 when success, -1 when failure happens
+ *
+ * \note Each returned handle is a new function object owned by the caller,
+ *  the same as MATXScriptFuncGetGlobal.
+ */
+MATX_DLL int MATXScriptFuncListGlobalNamesAndHandles(const char* prefix,
+                                                     int* out_size,
+                                                     const char*** out_names,
+                                                     MATXScriptFunctionHandle** out_handles);
+
 // Array related apis for quick proptyping
 /*!
  * \brief Allocate a nd-array's memory,
@@ -26,6 +26,7 @@ from ._c_ext.object import _to_runtime_object
 from ._c_ext.packed_func import PackedFuncBase
 from ._c_ext.packed_func import _get_global_func
 from ._c_ext.packed_func import to_packed_func
+from ._c_ext.packed_func import _handle_return_func
 from ._c_ext.packed_func import _set_class_packed_func
 from ._c_ext.packed_func import _set_class_module
 from ._c_ext.packed_func import _set_class_object_generic
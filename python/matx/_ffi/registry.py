@@ -23,12 +23,47 @@
 """FFI registry to register function and objects."""
 import sys
 import ctypes
+import functools
+import threading
 
-from .base import _LIB, check_call, py_str, c_str, string_types, _RUNTIME_ONLY
+from .base import _LIB, check_call, py_str, _RUNTIME_ONLY
 from ._selector import _register_object
 from ._selector import PackedFuncBase
 from ._selector import _get_global_func
 from ._selector import to_packed_func
+from ._selector import _handle_return_func
+
+# Declare the C signatures used here once, so that ctypes converts plain
+# python ints and bytes directly instead of requiring wrapper objects.
+_LIB.MATXScriptObjectTypeKey2Index.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_uint)]
+_LIB.MATXScriptObjectTypeKey2Index.restype = ctypes.c_int
+_LIB.MATXScriptFuncRegisterGlobal.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_int]
+_LIB.MATXScriptFuncRegisterGlobal.restype = ctypes.c_int
+_LIB.MATXScriptFuncListGlobalNames.argtypes = [
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)),
+]
+_LIB.MATXScriptFuncListGlobalNames.restype = ctypes.c_int
+_LIB.MATXScriptFuncListGlobalNamesAndHandles.argtypes = [
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p)),
+    ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p)),
+]
+_LIB.MATXScriptFuncListGlobalNamesAndHandles.restype = ctypes.c_int
+
+# scratch output slot for MATXScriptObjectTypeKey2Index
+_TIDX_SCRATCH = ctypes.c_uint()
+_TIDX_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4096)
+def _c_str_cached(string):
+    """Encode a python string as the utf-8 bytes passed to a c_char_p argument.
+
+    Type keys and function names are encoded once and reused afterwards.
+    """
+    return string.encode('utf-8')
 
 
 def register_object(type_key=None, callback=None):
@@ -60,17 +95,15 @@ def register_object(type_key=None, callback=None):
         if hasattr(cls, "_type_index"):
             tindex = cls._type_index
         else:
-            tidx = ctypes.c_uint()
-            if not _RUNTIME_ONLY:
-                check_call(_LIB.MATXScriptObjectTypeKey2Index(
-                    c_str(object_name), ctypes.byref(tidx)))
-            else:
-                # directly skip unknown objects during runtime.
+            with _TIDX_LOCK:
                 ret = _LIB.MATXScriptObjectTypeKey2Index(
-                    c_str(object_name), ctypes.byref(tidx))
-                if ret != 0:
+                    _c_str_cached(object_name), ctypes.byref(_TIDX_SCRATCH))
+                tindex = _TIDX_SCRATCH.value
+            if ret != 0:
+                if _RUNTIME_ONLY:
+                    # directly skip unknown objects during runtime.
                     return cls
-            tindex = tidx.value
+                check_call(ret)
 
         _register_object(tindex, cls, callback)
         return cls
@@ -127,17 +160,14 @@ def register_func(func_name, f=None, override=False):
     if not isinstance(func_name, str):
         raise ValueError("expect string function name")
 
-    ioverride = ctypes.c_int(override)
+    ioverride = int(override)
 
     def register(myf):
         """internal register function"""
         if not isinstance(myf, PackedFuncBase):
             myf = to_packed_func(myf)
-        handle = myf.handle
-        if not isinstance(handle, ctypes.c_void_p):
-            handle = ctypes.c_void_p(handle)
         check_call(_LIB.MATXScriptFuncRegisterGlobal(
-            c_str(func_name), handle, ioverride))
+            _c_str_cached(func_name), myf.handle, ioverride))
         return myf
 
     if f:
@@ -173,14 +203,12 @@ def list_global_func_names():
        List of global functions names.
     """
     plist = ctypes.POINTER(ctypes.c_char_p)()
-    size = ctypes.c_uint()
+    size = ctypes.c_int()
 
     check_call(_LIB.MATXScriptFuncListGlobalNames(ctypes.byref(size),
                                                   ctypes.byref(plist)))
-    fnames = []
-    for i in range(size.value):
-        fnames.append(py_str(plist[i]))
-    return fnames
+    # slicing the pointer converts all entries to bytes in a single C-level call
+    return list(map(py_str, plist[:size.value]))
 
 
 def extract_ext_funcs(finit):
@@ -233,19 +261,39 @@ def _init_api(namespace, target_module_name=None):
         _init_api_prefix(target_module_name, namespace)
 
 
+def _list_global_funcs_with_prefix(prefix):
+    """Get the global functions whose name starts with prefix.
+
+    Names and handles are fetched in a single C API call instead of
+    one MATXScriptFuncGetGlobal call per name. Functions of nested
+    namespaces (a '.' after the prefix) are filtered out on the C side.
+
+    Returns
+    -------
+    funcs : list of (str, int)
+       List of (function name, function handle) pairs.
+    """
+    plist = ctypes.POINTER(ctypes.c_char_p)()
+    hlist = ctypes.POINTER(ctypes.c_void_p)()
+    size = ctypes.c_int()
+
+    check_call(_LIB.MATXScriptFuncListGlobalNamesAndHandles(_c_str_cached(prefix),
+                                                            ctypes.byref(size),
+                                                            ctypes.byref(plist),
+                                                            ctypes.byref(hlist)))
+    return [(py_str(plist[i]), hlist[i]) for i in range(size.value)]
+
+
 def _init_api_prefix(module_name, prefix):
     module = sys.modules[module_name]
+    prefix_dot = prefix + "."
+    len_prefix = len(prefix_dot)
 
-    for name in list_global_func_names():
-        if not name.startswith(prefix):
-            continue
-
-        fname = name[len(prefix) + 1:]
+    for name, handle in _list_global_funcs_with_prefix(prefix_dot):
+        fname = name[len_prefix:]
         target_module = module
 
-        if fname.find(".") != -1:
-            continue
-        f = get_global_func(name)
+        f = _handle_return_func(handle)
         ff = _get_api(f)
         ff.__name__ = fname
         ff.__doc__ = ("PackedFunc %s. " % fname)
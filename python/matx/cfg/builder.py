@@ -25,36 +25,39 @@
 import copy
 
 from matx._typed_ast import ast
-from typing import List, Dict, Set, Optional, Union
+from typing import Any, Callable, List, Dict, Set, Optional, Tuple, Union
 from .model import Variable
 from .model import Block, BasicBlock, FunctionLabel
 from .model import ASTNodeContext
 
 
-class BasicBlocksBuilder(ast.NodeVisitor):
+class BasicBlocksBuilder(object):
     """BasicBlocksBuilder for control flow graph
 
-    BasicBlocksBuilder is an ast.NodeVisitor that can walk through
-    a program's AST and iteratively build the corresponding Blocks.
+    BasicBlocksBuilder can walk through a program's AST and iteratively
+    build the corresponding Blocks. Nodes are dispatched through a handler
+    table keyed on the node type (see `_BUILDER_HANDLERS`).
     """
 
     def __init__(self,
                  dead_blocks: List[Block],
                  ast_node_ctx: ASTNodeContext,
-                 ast_node: Union[ast.stmt, List[ast.stmt]]) -> None:
-        self.dead_blocks = dead_blocks
+                 ast_node: Union[ast.stmt, List[ast.stmt], List[ast.ExceptHandler]]) -> None:
+        self.dead_blocks: List[Block] = dead_blocks
         self.ast_node_ctx: ASTNodeContext = ast_node_ctx
-        self.ast_node = ast_node
-        self._cache = []
-        self.dead_stmts = []
-        self.begin_dead_stmt = False
+        self.ast_node: Union[ast.stmt, List[ast.stmt], List[ast.ExceptHandler]] = ast_node
+        self._cache: List[Union[ast.expr, ast.stmt]] = []
+        self.dead_stmts: List[Union[ast.expr, ast.stmt]] = []
+        self.begin_dead_stmt: bool = False
 
-    def __del__(self):
+    def flush_dead_stmts(self):
+        """move the collected dead stmts into a dead block"""
         if self.dead_stmts:
             dead_blk = BasicBlock.from_list(self.dead_stmts,
                                             self.ast_node_ctx)
             dead_blk.name = "L" + str(dead_blk.start_line)
             self.dead_blocks.append(dead_blk)
+            self.dead_stmts = []
 
     def flush(self, **kwargs):
         """create a BasicBlock from _cache"""
@@ -71,10 +74,19 @@ class BasicBlocksBuilder(ast.NodeVisitor):
         if len(self._cache) == 0 or self._cache[-1] != node:
             self._cache.append(node)
 
+    def visit(self, node: ast.AST):
+        handler = _BUILDER_HANDLERS.get(type(node), None)
+        if handler is None:
+            return self.generic_visit(node)
+        return handler(self, node)
+
     def generic_visit(self, node: ast.AST):
-        if isinstance(node, (ast.stmt,)):
+        if isinstance(node, ast.stmt):
             self._append_cache(node)
-        return super().generic_visit(node)
+        # expressions never contain statements, so only walk into the others
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, ast.expr):
+                self.visit(child)
 
     def get_basic_block(self):
         if isinstance(self.ast_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -93,6 +105,7 @@ class BasicBlocksBuilder(ast.NodeVisitor):
             if len(self._cache) > 0:
                 basic_block = self.flush()
                 yield basic_block
+            self.flush_dead_stmts()
 
     def visit_If(self, ast_node: ast.If):
         return self.visit_conditional_stmt(ast_node)
@@ -106,7 +119,7 @@ class BasicBlocksBuilder(ast.NodeVisitor):
     def visit_Try(self, ast_node: ast.Try):
         return self.visit_conditional_stmt(ast_node)
 
-    def visit_conditional_stmt(self, ast_node: Union[ast.stmt, ast.ExceptHandler]):
+    def visit_conditional_stmt(self, ast_node: ast.stmt):
         self._append_cache(ast_node)
         basic_block = self.flush()
         basic_block.block_end_type = ast_node.__class__.__name__
@@ -144,6 +157,19 @@ class BasicBlocksBuilder(ast.NodeVisitor):
         return [basic_block]
 
 
+_BUILDER_HANDLERS: Dict[type, Callable[[BasicBlocksBuilder, Any], Any]] = {
+    ast.If: BasicBlocksBuilder.visit_If,
+    ast.While: BasicBlocksBuilder.visit_While,
+    ast.For: BasicBlocksBuilder.visit_For,
+    ast.Try: BasicBlocksBuilder.visit_Try,
+    ast.FunctionDef: BasicBlocksBuilder.visit_FunctionDef,
+    ast.AsyncFunctionDef: BasicBlocksBuilder.visit_AsyncFunctionDef,
+    ast.Return: BasicBlocksBuilder.visit_Return,
+    ast.Break: BasicBlocksBuilder.visit_Break,
+    ast.Continue: BasicBlocksBuilder.visit_Continue,
+}
+
+
 class FunctionDeclaration(ast.expr):
     _fields = ('fn_args',)
 
@@ -190,9 +216,9 @@ class ExceptHandlerLabel(ast.expr):
         return "ExceptHandlerLabel: {} as {}".format(self.type, self.name)
 
 
-class LoadStoreSeparator(ast.NodeVisitor):
-    def __init__(self, variable_cache):
-        self.variable_cache: Dict[ast.Name, Variable] = variable_cache
+class LoadStoreSeparator(object):
+    def __init__(self, variable_cache: Dict[ast.AST, Variable]) -> None:
+        self.variable_cache: Dict[ast.AST, Variable] = variable_cache
         self.load: Set[Variable] = set()
         self.store: Set[Variable] = set()
 
@@ -203,19 +229,23 @@ class LoadStoreSeparator(ast.NodeVisitor):
         self.variable_cache[ast_node] = v
         return v
 
-    def visit_Name(self, node: ast.Name):
-        if isinstance(node.ctx, ast.Store):
-            self.store.add(self._make_var(node))
-        else:
-            self.load.add(self._make_var(node))
-
-    def visit_AugAssign(self, node: ast.AugAssign):
-        if isinstance(node.target, ast.Name):
-            self.load.add(self._make_var(node.target))
-        super().generic_visit(node)
-
-    def visit_arg(self, node: ast.arg):
-        self.store.add(self._make_var(node))
+    def visit(self, node: ast.AST):
+        # iterative walk instead of per-field NodeVisitor dispatch
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, ast.Name):
+                if isinstance(node.ctx, ast.Store):
+                    self.store.add(self._make_var(node))
+                else:
+                    self.load.add(self._make_var(node))
+            elif isinstance(node, ast.arg):
+                # annotations of args are not walked
+                self.store.add(self._make_var(node))
+            else:
+                if isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+                    self.load.add(self._make_var(node.target))
+                stack.extend(ast.iter_child_nodes(node))
 
 
 class CFG(object):
@@ -245,33 +275,40 @@ class CFG(object):
         # dead blocks
         self.dead_block_list: List[Block] = []
         # global var
-        self.globals_var = set()
-        self.block_set: Dict[ast.AST, Block] = {}
+        self.globals_var: Set[str] = set()
+        self.block_set: Dict[str, Block] = {}
         # build entry block
         self.entry_block, _, _, _ = self.parse(ast_tree)
         # define-use and use-define
         self.use_def_chains: Dict[Variable, Set[Variable]] = dict()
         self.def_use_chains: Dict[Variable, Set[Variable]] = dict()
         # variable cache
-        self.variable_cache: Dict[ast.Name, Variable] = {}
+        self.variable_cache: Dict[ast.AST, Variable] = {}
+        # variable name <-> bit index used by the var life bitsets
+        self._var_ids: Dict[str, int] = {}
+        self._var_names: List[str] = []
+        # load/store variables of each analysed statement, keyed by id(stmt)
+        self._load_store_cache: Dict[int, Tuple[Set[Variable], Set[Variable]]] = {}
 
     def __str__(self) -> str:
         return "CFG for {}".format(self.name)
 
-    def add_basic_block(self, basic_block: BasicBlock):
+    def add_basic_block(self, basic_block: Block):
         if basic_block.scope is not None:
             basic_block.scope.blocks.append(basic_block)
         self.block_list.append(basic_block)
 
-    def link_tail_to_cur_block(self, all_tail_list: List[BasicBlock], basic_block: BasicBlock):
-        for tail in all_tail_list:
-            self.connect_2_blocks(tail, basic_block)
-        all_tail_list[:] = []
+    def link_tail_to_cur_block(self, all_tail_list: List[Block], basic_block: Optional[Block]):
+        if basic_block is not None:
+            append_prev = basic_block.prev_block_list.append
+            for tail in all_tail_list:
+                tail.next_block_list.append(basic_block)
+                append_prev(tail)
+        all_tail_list.clear()
 
     def build(self, block, head, common_tail_list, loop_tail_list, func_tail_list):
-        method_str = "build_" + (block.block_end_type or '')
-        build_method = getattr(self, method_str, self.build_generic)
-        tail_list, loop_tail, func_tail = build_method(block)
+        build_method = _CFG_BUILD_HANDLERS.get(block.block_end_type, CFG.build_generic)
+        tail_list, loop_tail, func_tail = build_method(self, block)
         head = head or block
         self.link_tail_to_cur_block(common_tail_list, block)
         common_tail_list.extend(tail_list)
@@ -425,7 +462,8 @@ class CFG(object):
                     handlers_body_func_tail.extend(h_func_tail)
             loop_tail_list.extend(handlers_body_loop_tail)
             func_tail_list.extend(handlers_body_func_tail)
-        else_block, else_tail, else_func_tail = [], [], []
+        else_block: Optional[Block] = None
+        else_tail: List[Block] = []
         if has_else:
             else_block, else_tail, else_loop_tail, else_func_tail = self.parse(ast_try_node.orelse)
             loop_tail_list.extend(else_loop_tail)
@@ -485,7 +523,9 @@ class CFG(object):
 
     def parse(self, ast_body: Union[List[ast.ExceptHandler], ast.stmt, List[ast.stmt]]):
         head = None
-        common_tail_list, loop_tail_list, func_tail_list = [], [], []
+        common_tail_list: List[Block] = []
+        loop_tail_list: List[Block] = []
+        func_tail_list: List[Block] = []
         basic_block_parser = BasicBlocksBuilder(self.dead_block_list, self.ast_node_ctx, ast_body)
         for basic_block in basic_block_parser.get_basic_block():
             self.add_basic_block(basic_block)
@@ -499,8 +539,8 @@ class CFG(object):
         else:
             separated_block = BasicBlock(start_line=basic_block.end_line,
                                          end_line=basic_block.end_line)
-            separated_block.statements.append(basic_block.statements[-1])
-            basic_block.statements = basic_block.statements[:-1]
+            separated_block.statements.append(basic_block.statements.pop())
+            assert basic_block.end_line is not None
             basic_block.end_line -= 1
             self.connect_2_blocks(basic_block, separated_block)
             separated_block.block_end_type = block_end_type
@@ -510,7 +550,7 @@ class CFG(object):
             return separated_block
 
     @staticmethod
-    def connect_2_blocks(block1: Block, block2: Block):
+    def connect_2_blocks(block1: Optional[Block], block2: Optional[Block]):
         if block1 is not None and block2 is not None:
             block1.next_block_list.append(block2)
             block2.prev_block_list.append(block1)
@@ -520,28 +560,98 @@ class CFG(object):
         self.entry_block.fill_immediate_dominators(self.ast_node_ctx)
         self.entry_block.fill_dominance_frontier(self.ast_node_ctx, self.block_list)
 
+    def separate_load_store(self, stmt: ast.AST) -> Tuple[Set[Variable], Set[Variable]]:
+        # statements are kept alive by the blocks, so their ids are stable for the CFG lifetime
+        result = self._load_store_cache.get(id(stmt))
+        if result is None:
+            sep = LoadStoreSeparator(self.variable_cache)
+            sep.visit(stmt)
+            result = (sep.load, sep.store)
+            self._load_store_cache[id(stmt)] = result
+        return result
+
+    def _var_bit(self, name: str) -> int:
+        var_id = self._var_ids.get(name)
+        if var_id is None:
+            var_id = len(self._var_names)
+            self._var_ids[name] = var_id
+            self._var_names.append(name)
+        return 1 << var_id
+
+    def _bits_to_names(self, bits: int) -> Set[str]:
+        names = set()
+        while bits:
+            low_bit = bits & -bits
+            names.add(self._var_names[low_bit.bit_length() - 1])
+            bits ^= low_bit
+        return names
+
     def init_var_life_info(self):
         for block in self.block_list:
+            ue_var = 0
+            var_kill = 0
             for stmt in block.get_code_to_analyse():
-                sep = LoadStoreSeparator(self.variable_cache)
-                sep.visit(stmt)
-                for load_var in sep.load:
-                    load_var = load_var.name
-                    if load_var not in block.var_kill:
-                        block.ue_var.add(load_var)
-                        self.globals_var.add(load_var)
-                for store_var in sep.store:
-                    store_var = store_var.name
-                    block.var_kill.add(store_var)
-                    self.block_set[store_var] = block
+                loads, stores = self.separate_load_store(stmt)
+                for load_var in loads:
+                    load_bit = self._var_bit(load_var.name)
+                    if not var_kill & load_bit:
+                        ue_var |= load_bit
+                        self.globals_var.add(load_var.name)
+                for store_var in stores:
+                    var_kill |= self._var_bit(store_var.name)
+                    self.block_set[store_var.name] = block
+            block.ue_var_bits = ue_var
+            block.var_kill_bits = var_kill
+            block.live_in_bits = ue_var | (block.live_out_bits & ~var_kill)
+            block.ue_var = self._bits_to_names(ue_var)
+            block.var_kill = self._bits_to_names(var_kill)
+
+    def postorder_blocks(self) -> List[Block]:
+        """blocks in DFS postorder from the entry block, followed by the unreachable ones"""
+        order: List[Block] = []
+        visited: Set[Block] = set()
+        if self.entry_block is not None:
+            visited.add(self.entry_block)
+            stack = [(self.entry_block, iter(self.entry_block.next_block_list))]
+            while stack:
+                block, successors = stack[-1]
+                for next_block in successors:
+                    if next_block not in visited:
+                        visited.add(next_block)
+                        stack.append((next_block, iter(next_block.next_block_list)))
+                        break
+                else:
+                    stack.pop()
+                    order.append(block)
+        order.extend(block for block in self.block_list if block not in visited)
+        return order
 
     def compute_live_out_var(self):
+        # liveness is a backward problem, sweeping successors before
+        # predecessors usually reaches the fixed point in two passes
+        blocks = self.postorder_blocks()
+        # the dataflow runs over parallel arrays indexed by postorder position
+        index = {block: i for i, block in enumerate(blocks)}
+        succ = [[index[next_block] for next_block in block.next_block_list] for block in blocks]
+        ue_var = [block.ue_var_bits for block in blocks]
+        var_kill = [block.var_kill_bits for block in blocks]
+        live_in = [block.live_in_bits for block in blocks]
+        live_out = [block.live_out_bits for block in blocks]
         changed_flag = True
         while changed_flag:
             changed_flag = False
-            for blocks in self.block_list:
-                if blocks.recompute_live_out_var():
+            for i in range(len(blocks)):
+                new_live_out = 0
+                for j in succ[i]:
+                    new_live_out |= live_in[j]
+                if new_live_out & ~live_out[i]:
+                    live_out[i] = new_live_out
+                    live_in[i] = ue_var[i] | (new_live_out & ~var_kill[i])
                     changed_flag = True
+        for i, block in enumerate(blocks):
+            block.live_in_bits = live_in[i]
+            block.live_out_bits = live_out[i]
+            block.live_out = self._bits_to_names(live_out[i])
 
     def collect_ast_live_out_info(self):
         # In a block, if a name is live out, all asts with this name are view as live out
@@ -549,11 +659,10 @@ class CFG(object):
         for block in self.block_list:
             live_out = block.live_out
             for stmt in block.get_code_to_analyse():
-                sep = LoadStoreSeparator(self.variable_cache)
-                sep.visit(stmt)
-                for load_var in sep.load:
+                loads, stores = self.separate_load_store(stmt)
+                for load_var in loads:
                     result[load_var.ast_node] = load_var.name in live_out
-                for store_var in sep.store:
+                for store_var in stores:
                     result[store_var.ast_node] = store_var.name in live_out
         return result
 
@@ -563,9 +672,8 @@ class CFG(object):
         for block in self.block_list:
             reach_def_gens = {}
             for stmt in block.get_code_to_analyse():
-                sep = LoadStoreSeparator(self.variable_cache)
-                sep.visit(stmt)
-                for store_var in sep.store:
+                loads, stores = self.separate_load_store(stmt)
+                for store_var in stores:
                     reach_def_gens[store_var.name] = store_var
             for _, store_var in reach_def_gens.items():
                 block.reach_def_gen.add(store_var)
@@ -630,16 +738,15 @@ class CFG(object):
         for block in self.block_list:
             block_gens = {}
             for stmt in block.get_code_to_analyse():
-                sep = LoadStoreSeparator(self.variable_cache)
-                sep.visit(stmt)
-                for load_var in sep.load:
+                loads, stores = self.separate_load_store(stmt)
+                for load_var in loads:
                     if load_var.name in block_gens:
                         _update_use_def(load_var, block_gens[load_var.name])
                     else:
                         for v in block.reach_def_in:
                             if v.name == load_var.name:
                                 _update_use_def(load_var, v)
-                for store_var in sep.store:
+                for store_var in stores:
                     block_gens[store_var.name] = store_var
                     # init define-use as empty
                     self.def_use_chains[store_var] = set()
@@ -648,3 +755,16 @@ class CFG(object):
         for use, defines in self.use_def_chains.items():
             for v in defines:
                 self.def_use_chains[v].add(use)
+
+
+_CFG_BUILD_HANDLERS: Dict[Optional[str], Callable[[CFG, Any], Any]] = {
+    "If": CFG.build_If,
+    "FunctionDef": CFG.build_FunctionDef,
+    "Return": CFG.build_Return,
+    "Break": CFG.build_Break,
+    "Continue": CFG.build_Continue,
+    "While": CFG.build_While,
+    "For": CFG.build_For,
+    "Try": CFG.build_Try,
+    "Call": CFG.build_Call,
+}
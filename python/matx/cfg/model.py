@@ -43,14 +43,14 @@ class Variable:
             return f"Store Variable '{self.name}' in line {self.ast_node.lineno}"
 
     @property
-    def name(self):
+    def name(self) -> str:
         if isinstance(self.ast_node, ast.arg):
             return self.ast_node.arg
         else:
             return self.ast_node.id
 
     @property
-    def lineno(self):
+    def lineno(self) -> int:
         return self.ast_node.lineno
 
 
@@ -70,25 +70,31 @@ class Block:
         self.end_line: Optional[int] = end_line
         self.block_end_type: Optional[str] = block_end_type
         # links to the next blocks in a control flow graph.
-        self.next_block_list = []
+        self.next_block_list: List[Block] = []
         # Links to predecessors in a control flow graph.
-        self.prev_block_list = []
+        self.prev_block_list: List[Block] = []
         # dominator tree: https://www.cs.rice.edu/~keith/EMBED/dom.pdf
-        self.reverse_dominators = set()
-        self.immediate_dominators = []  # the forward link in the dominator tree
-        self.reverse_immediate_dominator = None  # the immediate parent in the dominator tree
-        self.dominance_frontier = []
+        self.reverse_dominators: Set[Block] = set()
+        self.immediate_dominators: List[Block] = []  # the forward link in the dominator tree
+        # the immediate parent in the dominator tree
+        self.reverse_immediate_dominator: Optional[Block] = None
+        self.dominance_frontier: List[Block] = []
         # var life info
-        self.var_kill = set()  # contains all the vars that are defined in this block
-        self.ue_var = set()  # contains all the variables that are from upward
-        self.live_out = set()  # contains all the vars that lives on exiting this block
+        self.var_kill: Set[str] = set()  # contains all the vars that are defined in this block
+        self.ue_var: Set[str] = set()  # contains all the variables that are from upward
+        self.live_out: Set[str] = set()  # contains all the vars that lives on exiting this block
+        # the same var life info as bitsets over the variable ids interned by the CFG
+        self.var_kill_bits: int = 0
+        self.ue_var_bits: int = 0
+        self.live_out_bits: int = 0
+        self.live_in_bits: int = 0
         # reaching definition
         self.reach_def_in: Set[Variable] = set()
         self.reach_def_out: Set[Variable] = set()
         self.reach_def_gen: Set[Variable] = set()
         self.reach_def_kill: Set[Variable] = set()
         # statements or condition in the block.
-        self.statements: List[ast.AST] = []
+        self.statements: List[Union[ast.expr, ast.stmt]] = []
         # a scope block containing this block
         self.scope: Optional[ScopeBlock] = scope
 
@@ -112,18 +118,6 @@ class Block:
     def get_num_of_parents(self):
         return len(self.prev_block_list)
 
-    def recompute_live_out_var(self):
-        new_live_out = set()
-        for next_block in self.next_block_list:
-            new_live_out.update(next_block.ue_var)
-            defined_live_out = next_block.live_out & next_block.var_kill
-            calculated_lo = next_block.live_out - defined_live_out
-            new_live_out.update(calculated_lo)
-        if len(new_live_out - self.live_out) == 0:
-            return False
-        self.live_out = new_live_out
-        return True
-
     def get_code_to_analyse(self):
         for code in self.statements:
             yield code
@@ -150,7 +144,7 @@ class ASTNodeContext:
         block = self._ast_node_to_block.get(ast_node, None)
         return block
 
-    def lookup_scope(self, ast_node: ast.AST) -> Optional[Block]:
+    def lookup_scope(self, ast_node: ast.AST) -> Optional["ScopeBlock"]:
         parent_node = self._ast_node_to_parent.get(ast_node, None)
         if parent_node is None:
             return None
@@ -187,11 +181,12 @@ class BasicBlock(Block):
     def from_list(cls, stmts: List[Union[ast.expr, ast.stmt]],
                   ctx: ASTNodeContext,
                   **kwargs):
+        """create a BasicBlock which takes ownership of stmts (the list is not copied)"""
         start_line = stmts[0].lineno
         end_line = stmts[-1].lineno
         c = cls(start_line=start_line, end_line=end_line)
+        c.statements = stmts
         for stmt in stmts:
-            c.add_statement(stmt)
             ctx.set_block(stmt, c)
             parent_block = ctx.lookup_scope(stmt)
             if c.scope is None:
@@ -314,7 +309,7 @@ class ScopeBlock(Block):
             return None
 
         for blk in self.blocks:
-            _visited = []
+            _visited: List[Block] = []
             idom_blk = _find_idom(blk, blk.reverse_dominators)
             blk.reverse_immediate_dominator = idom_blk
             if idom_blk:
@@ -355,11 +350,11 @@ class FunctionLabel(ScopeBlock):
             ast_node=ast_node,
             block_end_type=block_end_type,
         )
-        self.func_tail = []  # blocks that contain return stmt
+        self.func_tail: List[Block] = []  # blocks that contain return stmt
 
     @classmethod
     def from_ast(cls,
-                 ast_node: ast.FunctionDef,
+                 ast_node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
                  ctx: ASTNodeContext):
         block = cls(
             name=ast_node.name,
@@ -24,10 +24,10 @@ class LiveVariableAnalysis:
 
     def __init__(self, ast_func_def: ast.FunctionDef):
         my_cfg = cfg.CFG(ast_tree=ast_func_def)
-        my_cfg.fill_dominance_frontier()
+        # only the live-out info is consumed here, so dominance and
+        # reaching definitions are not computed
         my_cfg.init_var_life_info()
         my_cfg.compute_live_out_var()
-        my_cfg.compute_reaching_defines()
         self._live_out_mapping = my_cfg.collect_ast_live_out_info()
 
     def get_live_out_mapping(self):
@@ -42,6 +42,9 @@ USE_SO_CACHE = os.environ.get('MATX_USE_SO_CACHE', '').lower() != 'false'
 DISABLE_SCRIPT = os.environ.get('MATX_DISABLE_SCRIPT', '').lower() == 'true'
 DISABLE_GENERATE_CC = os.environ.get('MATX_DISABLE_GENERATE_CC', '').lower() == 'true'
 FLAG_COMPILED_OBJECT = object()
+# compiled contexts of classes scripted with cache=True. Entries live for the whole process:
+# a context keeps its class alive through main_node.raw.
+_SCRIPTED_CLASS_CACHE: Dict[type, context.ScriptContext] = {}
 
 
 class ArgumentValueError(ValueError):
@@ -351,7 +354,7 @@ def disable_script():
     DISABLE_SCRIPT = True
 
 
-def script(compiling_obj, *, share=False, toolchain=None, bundle_args=None):
+def script(compiling_obj, *, share=False, toolchain=None, bundle_args=None, cache=False):
     """Entry function for compiling. Given a python object including function,
     simple class, compile it to a matx4 object which mostly
     keep the behavior of the original python object.
@@ -361,16 +364,27 @@ def script(compiling_obj, *, share=False, toolchain=None, bundle_args=None):
         share (bool): if share this object
         toolchain (class): custom toolchains used to compile the generated c++ files
         bundle_args (list of str):
+        cache (bool): reuse the compiled context when the same class is scripted again.
+            Only for module level classes whose dependencies never change, as later
+            edits to them are not picked up.
 
     Returns:
         the compiled object.
     """
     if DISABLE_SCRIPT:
         return compiling_obj
-    result: context.ScriptContext = from_source(compiling_obj)
-    build_dso(result, toolchain is not None)
-    if toolchain is not None:
-        toolchain_build(result, toolchain)
+    use_class_cache = (cache and USE_SO_CACHE and toolchain is None
+                       and inspect.isclass(compiling_obj))
+    result: Optional[context.ScriptContext] = None
+    if use_class_cache:
+        result = _SCRIPTED_CLASS_CACHE.get(compiling_obj, None)
+    if result is None:
+        result = from_source(compiling_obj)
+        build_dso(result, toolchain is not None)
+        if toolchain is not None:
+            toolchain_build(result, toolchain)
+        elif use_class_cache and not result.free_vars:
+            _SCRIPTED_CLASS_CACHE[compiling_obj] = result
 
     if result.build_type is context.BuildType.FUNCTION:
         return make_jit_op_creator(result, share, bundle_args=bundle_args)()
@@ -41,12 +41,6 @@ class _LaplacianBlurOpImpl:
                  ksizes: List[int],
                  scales: List[float],
                  sync: int = ASYNC) -> List[matx.runtime.NDArray]:
-        batch_size: int = len(images)
-        assert len(
-            ksizes) == batch_size, "The ksize number for laplacian blur should be equal to batch size."
-        assert len(
-            scales) == batch_size, "The scale number for laplacian blur should be equal to batch size."
-
         return self.op.process(images, ksizes, scales, self.pad_type, sync)
 
 
@@ -63,7 +57,7 @@ class LaplacianBlurOp:
             device (Any) : the matx device used for the operation
             pad_type (str, optional) : pixel extrapolation method, if border_type is BORDER_CONSTANT, 0 would be used as border value.
         """
-        self.op: _LaplacianBlurOpImpl = matx.script(_LaplacianBlurOpImpl)(device, pad_type)
+        self.op: _LaplacianBlurOpImpl = matx.script(_LaplacianBlurOpImpl, cache=True)(device, pad_type)
 
     def __call__(self,
                  images: List[matx.runtime.NDArray],
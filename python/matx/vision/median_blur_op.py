@@ -37,10 +37,6 @@ class _MedianBlurOpImpl:
                  images: List[matx.runtime.NDArray],
                  ksizes: List[Tuple[int, int]],
                  sync: int = ASYNC) -> List[matx.runtime.NDArray]:
-        batch_size: int = len(images)
-        assert len(
-            ksizes) == batch_size, "The ksize number for median blur should be equal to batch size."
-
         return self.op.process(images, ksizes, sync)
 
 
@@ -54,7 +50,7 @@ class MedianBlurOp:
         Args:
             device (Any) : the matx device used for the operation
         """
-        self.op: _MedianBlurOpImpl = matx.script(_MedianBlurOpImpl)(device)
+        self.op: _MedianBlurOpImpl = matx.script(_MedianBlurOpImpl, cache=True)(device)
 
     def __call__(self,
                  images: List[matx.runtime.NDArray],
@@ -30,15 +30,18 @@ class Normalize(BaseInterfaceClass):
                  mean: List[float],
                  std: List[float],
                  global_scale: float = 1.0,
+                 dtype: str = "float32",
                  device_id: int = -2,
                  sync: int = ASYNC) -> None:
         super().__init__(device_id=device_id, sync=sync)
         self._mean: List[float] = mean
         self._std: List[float] = std
         self._global_scale: float = global_scale
+        self._dtype: str = dtype
 
     def __call__(self, device: Any, device_str: str, sync: int) -> Any:
-        return NormalizeImpl(device, device_str, self._mean, self._std, self._global_scale, sync)
+        return NormalizeImpl(device, device_str, self._mean, self._std,
+                             self._global_scale, self._dtype, sync)
 
 
 class NormalizeImpl(BatchBaseClass):
@@ -48,13 +51,15 @@ class NormalizeImpl(BatchBaseClass):
                  mean: List[float],
                  std: List[float],
                  global_scale: float = 1.0,
+                 dtype: str = "float32",
                  sync: int = ASYNC) -> None:
         super().__init__()
         self.global_scale: float = global_scale
         self.mean: List[float] = [i / global_scale for i in mean]
         self.std: List[float] = [i / global_scale for i in std]
+        self.dtype: str = dtype
         self.device_str: str = device_str
-        self.op: NormalizeOp = NormalizeOp(device, self.mean, self.std)
+        self.op: NormalizeOp = NormalizeOp(device, self.mean, self.std, dtype)
         self.sync: int = sync
         self.name: str = "Normalize"
 
@@ -62,5 +67,5 @@ class NormalizeImpl(BatchBaseClass):
         return self.op(imgs, sync=self.sync)
 
     def __repr__(self) -> str:
-        return self.name + '(mean={0}, std={1}, device={2}, sync={3})'.format(
-            self.mean, self.std, self.device_str, self.sync)
+        return self.name + '(mean={0}, std={1}, dtype={2}, device={3}, sync={4})'.format(
+            self.mean, self.std, self.dtype, self.device_str, self.sync)
@@ -96,6 +96,12 @@ def package_files(directory, f=None):
 with open('requirements.txt') as f:
     required = f.read().splitlines()
 
+ext_modules = []
+if os.environ.get("MATX_BUILD_MYPYC", "OFF").upper() in ("ON", "1", "TRUE"):
+    # compile the pure python CFG builder used by the script analysis with mypyc
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["matx/cfg/builder.py"])
+
 setup(
     name=NAME,
     version=VERSION,
@@ -108,4 +114,5 @@ setup(
         'matx': package_files(['matx']),
     },
     install_requires=required,
+    ext_modules=ext_modules,
     python_requires='>=3.6')
@@ -753,6 +753,8 @@ int MATXScriptFuncCreateFromCFunc(MATXScriptPackedCFunc func,
 struct MATXFuncThreadLocalEntry {
   /*! \brief result holder for returning string pointers */
   std::vector<const char*> ret_vec_charp;
+  /*! \brief result holder for returning function handles */
+  std::vector<MATXScriptFunctionHandle> ret_vec_handle;
 };
 
 /*! \brief Thread local store that can be used to hold return values. */
@@ -790,6 +792,39 @@ int MATXScriptFuncListGlobalNames(int* out_size, const char*** out_array) {
   API_END();
 }
 
+int MATXScriptFuncListGlobalNamesAndHandles(const char* prefix,
+                                            int* out_size,
+                                            const char*** out_names,
+                                            MATXScriptFunctionHandle** out_handles) {
+  API_BEGIN();
+  MATXFuncThreadLocalEntry* ret = MATXFuncThreadLocalStore::Get();
+  ::matxscript::runtime::string_view prefix_view(prefix);
+  auto ret_vec_str = ::matxscript::runtime::FunctionRegistry::ListNames();
+  ret->ret_vec_charp.clear();
+  ret->ret_vec_handle.clear();
+  for (size_t i = 0; i < ret_vec_str.size(); ++i) {
+    const auto& name = ret_vec_str[i];
+    if (name.substr(0, prefix_view.size()) != prefix_view) {
+      continue;
+    }
+    // only the direct members of the namespace, skip nested ones
+    if (name.find('.', prefix_view.size()) != ::matxscript::runtime::string_view::npos) {
+      continue;
+    }
+    const ::matxscript::runtime::NativeFunction* fp =
+        ::matxscript::runtime::FunctionRegistry::Get(name);
+    if (fp == nullptr) {
+      continue;
+    }
+    ret->ret_vec_charp.push_back(name.data());
+    ret->ret_vec_handle.push_back(new ::matxscript::runtime::NativeFunction(*fp));  // NOLINT(*)
+  }
+  *out_names = ::matxscript::runtime::BeginPtr(ret->ret_vec_charp);
+  *out_handles = ::matxscript::runtime::BeginPtr(ret->ret_vec_handle);
+  *out_size = static_cast<int>(ret->ret_vec_charp.size());
+  API_END();
+}
+
 int MATXScriptStreamCreate(int device_type, int device_id, MATXScriptStreamHandle* out) {
   API_BEGIN();
   MATXScriptDevice device;
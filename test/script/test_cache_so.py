@@ -31,6 +31,15 @@ def find_compile_log(output):
     return ''
 
 
+class MyCachedAdder:
+
+    def __init__(self, base: int) -> None:
+        self.base: int = base
+
+    def __call__(self, a: int) -> int:
+        return self.base + a
+
+
 class TestCacheSo(unittest.TestCase):
 
     def test_cache_hit(self):
@@ -91,6 +100,22 @@ class TestCacheSo(unittest.TestCase):
             self.assertIn('matx compile function/class', find_compile_log(log.output))
             self.assertEqual(d, 5)
 
+    def test_class_script_reused(self):
+        toolchain.USE_SO_CACHE = True
+        with self.assertLogs(level='INFO') as log:
+            a = matx.script(MyCachedAdder, cache=True)(1)
+            self.assertNotEqual(find_compile_log(log.output), '')
+            log.output.clear()
+
+            b = matx.script(MyCachedAdder, cache=True)(2)
+            self.assertEqual(find_compile_log(log.output), '')
+            self.assertEqual(a(1), 2)
+            self.assertEqual(b(1), 3)
+
+            c = matx.script(MyCachedAdder)(3)
+            self.assertIn('info matched, skip compiling', find_compile_log(log.output))
+            self.assertEqual(c(1), 4)
+
     # issue: #283
     def test_unpack(self):
         with self.assertLogs(level='INFO') as log:
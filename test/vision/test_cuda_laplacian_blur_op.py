@@ -78,6 +78,11 @@ class TestCudaLaplacianBlurOp(unittest.TestCase):
         op = matx.script(byted_vision.LaplacianBlurOp)(self.device)
         self._cuda_laplacian_blur_cpu_input_sync(op)
 
+    def test_cuda_laplacian_blur_invalid_params(self):
+        op = byted_vision.LaplacianBlurOp(self.device)
+        self.assertRaises(Exception, op, self.image_nd, self.ksizes[:2], self.scales)
+        self.assertRaises(Exception, op, self.image_nd, self.ksizes, self.scales[:2])
+
     def _helper(self, ret):
         for i in range(self.batch_size):
             np.testing.assert_almost_equal(
@@ -76,6 +76,28 @@ class TestCudaMedianBlurOp(unittest.TestCase):
         op = matx.script(byted_vision.MedianBlurOp)(self.device)
         self._cuda_median_blur_cpu_input_sync(op)
 
+    def test_cuda_median_blur_identity_ksize(self):
+        op = byted_vision.MedianBlurOp(self.device)
+        ksizes = [(1, 1), (3, 3), (1, 1)]
+        op_ret = op(self.image_nd, ksizes)
+        np.testing.assert_almost_equal(op_ret[0].asnumpy(), self.image_nd[0].asnumpy())
+        np.testing.assert_almost_equal(op_ret[1].asnumpy(), self.origin_res[0])
+        np.testing.assert_almost_equal(op_ret[2].asnumpy(), self.image_nd[2].asnumpy())
+
+    def test_cuda_median_blur_all_identity_ksize_sync(self):
+        op = byted_vision.MedianBlurOp(self.device)
+        ksizes = [(1, 1)] * self.batch_size
+        op_ret = op(self.image_nd_cpu, ksizes, byted_vision.SYNC_CPU)
+        for i in range(self.batch_size):
+            self.assertEqual(op_ret[i].device(), "cpu")
+            np.testing.assert_almost_equal(op_ret[i].asnumpy(), self.image_nd_cpu[i].asnumpy())
+
+    def test_cuda_median_blur_invalid_ksize(self):
+        op = byted_vision.MedianBlurOp(self.device)
+        self.assertRaises(Exception, op, self.image_nd, self.ksizes[:2])
+        self.assertRaises(Exception, op, self.image_nd, [(0, 3), (3, 3), (3, 3)])
+        self.assertRaises(Exception, op, self.image_nd, [(4, 4), (3, 3), (3, 3)])
+
     def _helper(self, ret):
         for i in range(self.batch_size):
             np.testing.assert_almost_equal(
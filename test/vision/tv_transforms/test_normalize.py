@@ -26,7 +26,7 @@ import numpy as np
 import matx
 import torch
 from torchvision import transforms
-from matx.vision.tv_transforms import Compose, Normalize
+from matx.vision.tv_transforms import Compose, Normalize, ToTensor
 
 
 script_path = os.path.dirname(os.path.abspath(os.path.expanduser(__file__)))
@@ -48,6 +48,26 @@ class TestNormalize(unittest.TestCase):
         torchvision_res = torchvision_op(self.img_tensor).permute(1, 2, 0).numpy()
         np.testing.assert_almost_equal(bytedvision_res, torchvision_res)
 
+    def test_normalize_float16(self):
+        bytedvision_op = Compose(0, [Normalize([10, 20, 30], [225, 225, 225], dtype="float16")])
+        bytedvision_res = bytedvision_op([self.img_nd])[0].asnumpy()
+        self.assertEqual(bytedvision_res.dtype, np.float16)
+        torchvision_op = transforms.Normalize([10, 20, 30], [225, 225, 225])
+        torchvision_res = torchvision_op(self.img_tensor).permute(1, 2, 0).numpy()
+        np.testing.assert_allclose(bytedvision_res.astype("float32"), torchvision_res, atol=1e-2)
+
+    def test_normalize_float16_to_tensor(self):
+        bytedvision_op = Compose(0, [
+            Normalize([10, 20, 30], [225, 225, 225], dtype="float16"),
+            ToTensor()
+        ])
+        bytedvision_res = bytedvision_op([self.img_nd, self.img_nd]).asnumpy()
+        self.assertEqual(bytedvision_res.dtype, np.float16)
+        assert len(bytedvision_res.shape) == 4
+        torchvision_op = transforms.Normalize([10, 20, 30], [225, 225, 225])
+        torchvision_res = torchvision_op(self.img_tensor).numpy()
+        np.testing.assert_allclose(bytedvision_res[0].astype("float32"), torchvision_res, atol=1e-2)
+
     def test_scripted_normalize(self):
         op = matx.script(Normalize)([10, 20, 30], [225, 225, 225])
         composed_op = matx.script(Compose)(0, [op])
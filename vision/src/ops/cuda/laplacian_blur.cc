@@ -62,6 +62,20 @@ RTValue VisionLaplacianBlurOpGPU::process(const List& arg_images,
   int batch_size = images.size();
   int cv_border_type = UnicodePadTypesToCVBorderTypes(borderType);
 
+  MXCHECK_EQ(ksize_in.size(), batch_size)
+      << "The ksize number for laplacian blur should be equal to batch size.";
+  MXCHECK_EQ(scale_in.size(), batch_size)
+      << "The scale number for laplacian blur should be equal to batch size.";
+
+  // unpack the per-image params into the arrays handed to the kernel before any
+  // cuda resource is allocated, so a bad element can not leak the event or workspace
+  double scale[batch_size];
+  int ksize[batch_size];
+  for (int i = 0; i < batch_size; ++i) {
+    ksize[i] = ksize_in[i].As<int>();
+    scale[i] = scale_in[i].As<double>();
+  }
+
   cudaStream_t cu_stream = getStream();
   cudaEvent_t finish_event;
   CHECK_CUDA_CALL(cudaEventCreate(&finish_event));
@@ -81,8 +95,6 @@ RTValue VisionLaplacianBlurOpGPU::process(const List& arg_images,
   int channel = 0;
   DataType nd_data_type;
   List res;
-  double scale[batch_size];
-  int ksize[batch_size];
 
   int i = 0;
   for (const RTValue& nd_elem : images) {
@@ -136,8 +148,6 @@ RTValue VisionLaplacianBlurOpGPU::process(const List& arg_images,
         0,
         nullptr);
     res.push_back(dst_arr);
-    scale[i] = scale_in[i].As<double>();
-    ksize[i] = ksize_in[i].As<int>();
     output_ptr[i] = (void*)(dst_arr->data);
     i += 1;
   }
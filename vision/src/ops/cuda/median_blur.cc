@@ -29,6 +29,7 @@
 #include "matxscript/runtime/runtime_value.h"
 #include "utils/cuda/cuda_op_helper.h"
 #include "utils/cuda/cuda_type_helper.h"
+#include "utils/cuda/nvtx_range.h"
 #include "utils/pad_types.h"
 #include "vision_base_op_gpu.h"
 
@@ -46,6 +47,7 @@ class VisionMedianBlurOpGPU : public VisionBaseImageOpGPU<cuda_op::MedianBlurVar
 };
 
 RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize_in, int sync) {
+  NvtxRange nvtx_range("MedianBlur");
   // TODO: check if necessary
   check_and_set_device(device_id_);
   auto images = check_copy(arg_images, ctx_, getStream());
@@ -53,6 +55,23 @@ RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize
   // parse input
   int batch_size = images.size();
 
+  MXCHECK_EQ(ksize_in.size(), batch_size)
+      << "The ksize number for median blur should be equal to batch size.";
+
+  // unpack the per-image ksizes into the array handed to the kernel before any
+  // cuda resource is allocated, so a bad element can not leak the event or workspace
+  cv::Size cv_ksize[batch_size];
+  for (int i = 0; i < batch_size; ++i) {
+    auto ksize_view = ksize_in[i].AsObjectView<Tuple>();
+    const Tuple& cur_ksize = ksize_view.data();
+    MXCHECK_EQ(cur_ksize.size(), 2) << "The ksize for median blur should be a tuple (x, y).";
+    cv_ksize[i] = cv::Size(cur_ksize[0].As<int>(), cur_ksize[1].As<int>());
+    MXCHECK(cv_ksize[i].width > 0 && cv_ksize[i].height > 0 && cv_ksize[i].width % 2 == 1 &&
+            cv_ksize[i].height % 2 == 1)
+        << "The ksize for median blur should be positive and odd, but get (" << cv_ksize[i].width
+        << ", " << cv_ksize[i].height << ")";
+  }
+
   cudaStream_t cu_stream = getStream();
   cudaEvent_t finish_event;
   CHECK_CUDA_CALL(cudaEventCreate(&finish_event));
@@ -72,13 +91,14 @@ RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize
   int channel = 0;
   DataType nd_data_type;
   List res;
-  cv::Size cv_ksize[batch_size];
 
+  // images with a 1x1 ksize are copied instead of being sent to the kernel,
+  // kernel_batch_size counts the images compacted into the kernel arrays
+  int kernel_batch_size = 0;
   int i = 0;
   for (const RTValue& nd_elem : images) {
     auto view_elem = nd_elem.AsObjectView<NDArray>();
     const NDArray& elem = view_elem.data();
-    input_ptr[i] = (void*)(elem->data);
     std::vector<int64_t> src_shape = elem.Shape();
 
     if (i == 0) {
@@ -92,10 +112,6 @@ RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize
         MXCHECK(false) << "The inputs must have same data type";
       }
     }
-    input_shape[i].N = 1;
-    input_shape[i].C = channel;
-    input_shape[i].H = src_shape[0];
-    input_shape[i].W = src_shape[1];
     size_t output_buffer_size = CalculateOutputBufferSize(src_shape, nd_data_type);
 
     NDArray dst_arr = MakeNDArrayWithWorkSpace(
@@ -126,27 +142,36 @@ RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize
         0,
         nullptr);
     res.push_back(dst_arr);
-    auto ksize_view = ksize_in[i].AsObjectView<Tuple>();
-    const Tuple& cur_ksize = ksize_view.data();
-    int ksize_x = cur_ksize[0].As<int>();
-    int ksize_y = cur_ksize[1].As<int>();
-    cv_ksize[i] = cv::Size(ksize_x, ksize_y);
-    output_ptr[i] = (void*)(dst_arr->data);
+    if (cv_ksize[i].width == 1 && cv_ksize[i].height == 1) {
+      CHECK_CUDA_CALL(cudaMemcpyAsync(
+          dst_arr->data, elem->data, output_buffer_size, cudaMemcpyDeviceToDevice, cu_stream));
+    } else {
+      input_ptr[kernel_batch_size] = (void*)(elem->data);
+      output_ptr[kernel_batch_size] = (void*)(dst_arr->data);
+      input_shape[kernel_batch_size].N = 1;
+      input_shape[kernel_batch_size].C = channel;
+      input_shape[kernel_batch_size].H = src_shape[0];
+      input_shape[kernel_batch_size].W = src_shape[1];
+      cv_ksize[kernel_batch_size] = cv_ksize[i];
+      kernel_batch_size += 1;
+    }
     i += 1;
   }
   cuda_op::DataType op_data_type = DLDataTypeToOpencvCudaType(nd_data_type);
 
-  op_->infer(input_ptr,
-             output_ptr,
-             gpu_workspace,
-             (void*)cpu_buffer_ptr.get(),
-             batch_size,
-             op_buffer_size,
-             cv_ksize,
-             input_shape,
-             cuda_op::kNHWC,
-             op_data_type,
-             cu_stream);
+  if (kernel_batch_size > 0) {
+    op_->infer(input_ptr,
+               output_ptr,
+               gpu_workspace,
+               (void*)cpu_buffer_ptr.get(),
+               kernel_batch_size,
+               op_buffer_size,
+               cv_ksize,
+               input_shape,
+               cuda_op::kNHWC,
+               op_data_type,
+               cu_stream);
+  }
 
   // record stop event on the stream
   CHECK_CUDA_CALL(cudaEventRecord(finish_event, cu_stream));
@@ -154,13 +179,13 @@ RTValue VisionMedianBlurOpGPU::process(const List& arg_images, const List& ksize
   CUDA_STREAM_SYNC_IF_DEBUG(cu_stream);
   CUDA_DEVICE_SYNC_IF_DEBUG();
 
+  if (sync == VISION_SYNC_MODE::SYNC_CPU) {
+    // the d2h copies are queued on cu_stream behind the kernel and to_cpu waits for them,
+    // so there is no need to block on finish_event first
+    return to_cpu(res, getStream());
+  }
   if (sync != VISION_SYNC_MODE::ASYNC) {
     CHECK_CUDA_CALL(cudaEventSynchronize(finish_event));
-    if (sync == VISION_SYNC_MODE::SYNC_CPU) {
-      return to_cpu(res, getStream());
-    } else {
-      return res;
-    }
   }
   return res;
 }
@@ -0,0 +1,69 @@
+// Copyright 2022 ByteDance Ltd. and/or its affiliates.
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+#include "nvtx_range.h"
+
+#include <cstdlib>
+#include <cstring>
+
+// nvtx3 is header only and ships with the cuda toolkit since 10.0,
+// fall back to no-op ranges when it is not on the include path
+#if defined(__has_include)
+#if __has_include(<nvtx3/nvToolsExt.h>)
+#include <nvtx3/nvToolsExt.h>
+#define MATX_VISION_HAS_NVTX 1
+#endif
+#endif
+
+namespace byted_matx_vision {
+namespace ops {
+namespace cuda {
+
+bool NvtxEnabled() {
+#ifdef MATX_VISION_HAS_NVTX
+  static const bool enabled = [] {
+    const char* env = std::getenv("MATX_NVTX");
+    return env != nullptr && std::strcmp(env, "1") == 0;
+  }();
+  return enabled;
+#else
+  return false;
+#endif
+}
+
+NvtxRange::NvtxRange(const char* name) : active_(NvtxEnabled()) {
+#ifdef MATX_VISION_HAS_NVTX
+  if (active_) {
+    nvtxRangePushA(name);
+  }
+#endif
+}
+
+NvtxRange::~NvtxRange() {
+#ifdef MATX_VISION_HAS_NVTX
+  if (active_) {
+    nvtxRangePop();
+  }
+#endif
+}
+
+}  // namespace cuda
+}  // namespace ops
+}  // namespace byted_matx_vision
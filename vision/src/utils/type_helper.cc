@@ -64,6 +64,14 @@ DLDataType OpencvDepthToDLDataType(int opencv_depth) {
       t.code = kDLInt;
       return t;
     } break;
+#ifdef CV_16F
+    // CV_16F
+    case CV_16F: {
+      t.bits = 16;
+      t.code = kDLFloat;
+      return t;
+    } break;
+#endif
     // CV_32F
     case CV_32F: {
       t.bits = 32;
@@ -121,6 +129,12 @@ int DLDataTypeToOpencvDepth(DataType dtype) {
       } else if (bits == 64) {
         return CV_64F;
       }
+#ifdef CV_16F
+      // CV_16F
+      if (bits == 16) {
+        return CV_16F;
+      }
+#endif
     } break;
   }
   MXLOG(FATAL) << "unknown type code " << type_code;
@@ -167,6 +181,12 @@ int DLDataTypeToOpencvType(DataType dtype, int dim) {
       } else if (bits == 64) {
         return CV_MAKETYPE(CV_64F, dim);
       }
+#ifdef CV_16F
+      // CV_16F
+      if (bits == 16) {
+        return CV_MAKETYPE(CV_16F, dim);
+      }
+#endif
     } break;
   }
   MXLOG(FATAL) << "unknown type_code " << type_code;
@@ -180,6 +200,9 @@ int UnicodeTypeToOpencvDepth(unicode_view opencv_depth) {
                                     {U"uint16", CV_16U},
                                     {U"int16", CV_16S},
                                     {U"int32", CV_32S},
+#ifdef CV_16F
+                                    {U"float16", CV_16F},
+#endif
                                     {U"float32", CV_32F},
                                     {U"float64", CV_64F}};
   MXCHECK_GT(opencv_depth.size(), 0) << "Unicode type is empty, please check !";